@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import logging
+import struct
+from typing import Final
 
 _LOGGER = logging.getLogger(__name__)
 
+CW_UNPACK: Final = struct.Struct(">H").unpack_from
+
 # Off d94b2d012b3c4864106124
 # on  d94b2d012b3c4a641061a4
 # Off d94b2d012b3c4b64106124
@@ -21,6 +25,6 @@ def process_woceiling(data: bytes, mfr_data: bytes | None) -> dict[str, bool | i
         "sequence_number": mfr_data[6],
         "isOn": bool(mfr_data[10] & 0b10000000),
         "brightness": mfr_data[7] & 0b01111111,
-        "cw": int(mfr_data[8:10].hex(), 16),
+        "cw": CW_UNPACK(mfr_data, 8)[0],
         "color_mode": 1,
     }
@@ -10,27 +10,34 @@ def process_wocontact(
     if data is None and mfr_data is None:
         return {}
 
-    battery = data[2] & 0b01111111 if data else None
-    tested = bool(data[1] & 0b10000000) if data else None
+    try:
+        battery = data[2] & 0b01111111
+        tested = bool(data[1] & 0b10000000)
+    except (TypeError, IndexError):
+        battery = tested = None
 
-    if mfr_data and len(mfr_data) >= 13:
-        motion_detected = bool(mfr_data[7] & 0b10000000)
-        contact_open = bool(mfr_data[7] & 0b00010000)
-        contact_timeout = bool(mfr_data[7] & 0b00100000)
+    # contact_open masks in the timeout bit too, timeout still means its open
+    try:
+        flags = mfr_data[7]
         button_count = mfr_data[12] & 0b00001111
-        is_light = bool(mfr_data[7] & 0b01000000)
-    else:
+    except (TypeError, IndexError):
+        # Missing or short manufacturer data, fall back to service data
         motion_detected = bool(data[1] & 0b01000000)
-        contact_open = bool(data[3] & 0b00000010)
+        contact_open = bool(data[3] & 0b00000110)
         contact_timeout = bool(data[3] & 0b00000100)
         button_count = data[8] & 0b00001111
         is_light = bool(data[3] & 0b00000001)
+    else:
+        motion_detected = bool(flags & 0b10000000)
+        contact_open = bool(flags & 0b00110000)
+        contact_timeout = bool(flags & 0b00100000)
+        is_light = bool(flags & 0b01000000)
 
     return {
         "tested": tested,
         "motion_detected": motion_detected,
         "battery": battery,
-        "contact_open": contact_open or contact_timeout,  # timeout still means its open
+        "contact_open": contact_open,
         "contact_timeout": contact_timeout,
         "is_light": is_light,
         "button_count": button_count,
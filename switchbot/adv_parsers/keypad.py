@@ -15,8 +15,9 @@ def process_wokeypad(
     if data is None or mfr_data is None:
         return {"battery": None, "attempt_state": None}
 
-    _LOGGER.debug("mfr_data: %s", mfr_data.hex())
-    if data:
-        _LOGGER.debug("data: %s", data.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("mfr_data: %s", mfr_data.hex())
+        if data:
+            _LOGGER.debug("data: %s", data.hex())
 
     return {"battery": data[2] & 0b01111111, "attempt_state": mfr_data[6]}
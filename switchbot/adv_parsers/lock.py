@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from ..const import LockStatus
+from ..const import LOCK_STATUS_BY_VALUE, LockStatus
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,14 +14,20 @@ def process_wolock(data: bytes | None, mfr_data: bytes | None) -> dict[str, bool
     if mfr_data is None:
         return {}
 
-    _LOGGER.debug("mfr_data: %s", mfr_data.hex())
-    if data:
-        _LOGGER.debug("data: %s", data.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("mfr_data: %s", mfr_data.hex())
+        if data:
+            _LOGGER.debug("data: %s", data.hex())
+
+    try:
+        battery = data[2] & 0b01111111
+    except (TypeError, IndexError):
+        battery = None
 
     return {
-        "battery": data[2] & 0b01111111 if data else None,
+        "battery": battery,
         "calibration": bool(mfr_data[7] & 0b10000000),
-        "status": LockStatus((mfr_data[7] & 0b01110000) >> 4),
+        "status": LOCK_STATUS_BY_VALUE[(mfr_data[7] & 0b01110000) >> 4],
         "update_from_secondary_lock": bool(mfr_data[7] & 0b00001000),
         "door_open": bool(mfr_data[7] & 0b00000100),
         "double_lock_mode": bool(mfr_data[8] & 0b10000000),
@@ -35,14 +41,15 @@ def process_wolock(data: bytes | None, mfr_data: bytes | None) -> dict[str, bool
 def process_wolock_pro(
     data: bytes | None, mfr_data: bytes | None
 ) -> dict[str, bool | int]:
-    _LOGGER.debug("mfr_data: %s", mfr_data.hex())
-    if data:
-        _LOGGER.debug("data: %s", data.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("mfr_data: %s", mfr_data.hex())
+        if data:
+            _LOGGER.debug("data: %s", data.hex())
 
     res = {
         "battery": data[2] & 0b01111111 if data else None,
         "calibration": bool(mfr_data[7] & 0b10000000),
-        "status": LockStatus((mfr_data[7] & 0b00111000) >> 3),
+        "status": LOCK_STATUS_BY_VALUE[(mfr_data[7] & 0b00111000) >> 3],
         "door_open": bool(mfr_data[8] & 0b01100000),
         # Double lock mode is not supported on Lock Pro
         "update_from_secondary_lock": False,
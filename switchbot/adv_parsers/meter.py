@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 import struct
-from typing import Any
+from typing import Any, Final
 
-CO2_UNPACK = struct.Struct(">H").unpack_from
+CO2_UNPACK: Final = struct.Struct(">H").unpack_from
+TEMP_FRAME: Final = struct.Struct("BBB")
+# Translation table masking off the high bit of every byte
+STRIP_HIGH_BIT: Final = bytes(i & 0b01111111 for i in range(256))
+
+
+def _decode_temperature(decimal: int, integer: int) -> float:
+    """Decode the signed celsius value from the decimal and integer bytes."""
+    _temp_sign = 1 if integer & 0b10000000 else -1
+    return _temp_sign * ((integer & 0b01111111) + ((decimal & 0b00001111) / 10))
 
 
 def process_wosensorth(data: bytes | None, mfr_data: bytes | None) -> dict[str, Any]:
@@ -24,10 +33,7 @@ def process_wosensorth(data: bytes | None, mfr_data: bytes | None) -> dict[str,
     if not temp_data:
         return {}
 
-    _temp_sign = 1 if temp_data[1] & 0b10000000 else -1
-    _temp_c = _temp_sign * (
-        (temp_data[1] & 0b01111111) + ((temp_data[0] & 0b00001111) / 10)
-    )
+    _temp_c = _decode_temperature(temp_data[0], temp_data[1])
     _temp_f = (_temp_c * 9 / 5) + 32
     _temp_f = (_temp_f * 10) / 10
     humidity = temp_data[2] & 0b01111111
@@ -54,3 +60,21 @@ def process_wosensorth_c(data: bytes | None, mfr_data: bytes | None) -> dict[str
         co2_data = mfr_data[13:15]
         _wosensorth_data["co2"] = CO2_UNPACK(co2_data)[0]
     return _wosensorth_data
+
+
+def process_wosensorth_bulk(temp_bytes: bytes) -> dict[str, tuple[Any, ...]]:
+    """Process a buffer of concatenated 3 byte woSensorTH temperature frames.
+
+    The result is column oriented so it can be handed straight to numpy.
+    """
+    temperature: list[float] = []
+    fahrenheit: list[bool] = []
+    for decimal, integer, humi in TEMP_FRAME.iter_unpack(temp_bytes):
+        temperature.append(_decode_temperature(decimal, integer))
+        fahrenheit.append(bool(humi & 0b10000000))
+
+    return {
+        "temperature": tuple(temperature),
+        "humidity": tuple(temp_bytes[2::3].translate(STRIP_HIGH_BIT)),
+        "fahrenheit": tuple(fahrenheit),
+    }
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import struct
+from typing import Final
+
+RELAY_SWITCH_1PM_UNPACK: Final = struct.Struct(">6xBB2xH").unpack_from
+RELAY_SWITCH_1_UNPACK: Final = struct.Struct(">6xBB").unpack_from
+
 
 def process_worelay_switch_1pm(
     data: bytes | None, mfr_data: bytes | None
@@ -9,11 +15,12 @@ def process_worelay_switch_1pm(
     """Process WoStrip services data."""
     if mfr_data is None:
         return {}
+    sequence_number, flags, power = RELAY_SWITCH_1PM_UNPACK(mfr_data)
     return {
         "switchMode": True,  # for compatibility, useless
-        "sequence_number": mfr_data[6],
-        "isOn": bool(mfr_data[7] & 0b10000000),
-        "power": ((mfr_data[10] << 8) + mfr_data[11]) / 10,
+        "sequence_number": sequence_number,
+        "isOn": flags & 0b10000000 != 0,
+        "power": power / 10,
         "voltage": 0,
         "current": 0,
     }
@@ -25,8 +32,9 @@ def process_worelay_switch_1(
     """Process WoStrip services data."""
     if mfr_data is None:
         return {}
+    sequence_number, flags = RELAY_SWITCH_1_UNPACK(mfr_data)
     return {
         "switchMode": True,  # for compatibility, useless
-        "sequence_number": mfr_data[6],
-        "isOn": bool(mfr_data[7] & 0b10000000),
+        "sequence_number": sequence_number,
+        "isOn": flags & 0b10000000 != 0,
     }
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Final
 
 from .enum import StrEnum
 
-DEFAULT_RETRY_COUNT = 3
-DEFAULT_RETRY_TIMEOUT = 1
-DEFAULT_SCAN_TIMEOUT = 5
+DEFAULT_RETRY_COUNT: Final = 3
+DEFAULT_RETRY_TIMEOUT: Final = 1
+DEFAULT_SCAN_TIMEOUT: Final = 5
 
 
 class SwitchbotApiError(RuntimeError):
@@ -67,3 +68,7 @@ class LockStatus(Enum):
     LOCKING_STOP = 4  # LOCKING_BLOCKED
     UNLOCKING_STOP = 5  # UNLOCKING_BLOCKED
     NOT_FULLY_LOCKED = 6  # LATCH_LOCKED - Only EU lock type
+
+
+# Enum value lookups walk the enum machinery, a plain dict is much cheaper
+LOCK_STATUS_BY_VALUE = {status.value: status for status in LockStatus}
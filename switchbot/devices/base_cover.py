@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 from abc import abstractmethod
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 from .device import REQ_HEADER, SwitchbotDevice, update_after_operation
@@ -24,6 +26,27 @@ STOP_KEYS = [f"{REQ_HEADER}{COVER_COMMAND}0001", f"{REQ_HEADER}{COVER_COMMAND}00
 COVER_EXT_SUM_KEY = f"{REQ_HEADER}460401"
 COVER_EXT_ADV_KEY = f"{REQ_HEADER}460402"
 
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({1})
+
+STATE_OF_CHARGE = (
+    "not_charging",
+    "charging_by_adapter",
+    "charging_by_solar",
+    "fully_charged",
+    "solar_not_charging",
+    "charging_error",
+)
+
+
+@lru_cache(maxsize=256)
+def _position_commands(position: int, speed: int) -> tuple[str, str]:
+    """Return the commands that move the cover to a position."""
+    position_hex = f"{position:02X}"
+    return (
+        f"{POSITION_KEYS[0]}{position_hex}",
+        f"{POSITION_KEYS[1]}{speed:02X}{position_hex}",
+    )
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +65,7 @@ class SwitchbotBaseCover(SwitchbotDevice):
         self._is_opening: bool = False
         self._is_closing: bool = False
 
-    async def _send_multiple_commands(self, keys: list[str]) -> bool:
+    async def _send_multiple_commands(self, keys: Sequence[str]) -> bool:
         """Send multiple commands to device.
 
         Since we current have no way to tell which command the device
@@ -51,7 +74,9 @@ class SwitchbotBaseCover(SwitchbotDevice):
         final_result = False
         for key in keys:
             result = await self._send_command(key)
-            final_result |= self._check_command_result(result, 0, {1})
+            final_result |= self._check_command_result(
+                result, 0, COMMAND_RESULT_EXPECTED_VALUES
+            )
         return final_result
 
     @update_after_operation
@@ -63,12 +88,7 @@ class SwitchbotBaseCover(SwitchbotDevice):
     async def set_position(self, position: int, speed: int = 255) -> bool:
         """Send position command (0-100) to device. Speed 255 - normal, 1 - slow"""
         position = (100 - position) if self._reverse else position
-        return await self._send_multiple_commands(
-            [
-                f"{POSITION_KEYS[0]}{position:02X}",
-                f"{POSITION_KEYS[1]}{speed:02X}{position:02X}",
-            ]
-        )
+        return await self._send_multiple_commands(_position_commands(position, speed))
 
     @abstractmethod
     def get_position(self) -> Any:
@@ -94,19 +114,10 @@ class SwitchbotBaseCover(SwitchbotDevice):
             _LOGGER.error("%s: Unsuccessful, please try again", self.name)
             return None
 
-        _state_of_charge = [
-            "not_charging",
-            "charging_by_adapter",
-            "charging_by_solar",
-            "fully_charged",
-            "solar_not_charging",
-            "charging_error",
-        ]
-
         self.ext_info_adv["device0"] = {
             "battery": _data[1],
             "firmware": _data[2] / 10.0,
-            "stateOfCharge": _state_of_charge[_data[3]],
+            "stateOfCharge": STATE_OF_CHARGE[_data[3]],
         }
 
         # If grouped curtain device present.
@@ -114,7 +125,7 @@ class SwitchbotBaseCover(SwitchbotDevice):
             self.ext_info_adv["device1"] = {
                 "battery": _data[4],
                 "firmware": _data[5] / 10.0,
-                "stateOfCharge": _state_of_charge[_data[6]],
+                "stateOfCharge": STATE_OF_CHARGE[_data[6]],
             }
 
         return self.ext_info_adv
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import asyncio
 import logging
+import struct
 import time
 from abc import abstractmethod
 from typing import Any
 
 from ..models import SwitchBotAdvertisement
-from .device import ColorMode, SwitchbotDevice
+from .device import COLOR_MODE_BY_VALUE, ColorMode, SwitchbotDevice
+
+# Byte 1 of the result holds the on/off state after the command
+ON_STATE_VALUES = frozenset({0x80})
+OFF_STATE_VALUES = frozenset({0x00})
+
+BRIGHTNESS_COLOR_TEMP_PACK = struct.Struct(">BH").pack
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,9 +34,11 @@ class SwitchbotBaseLight(SwitchbotDevice):
     @property
     def rgb(self) -> tuple[int, int, int] | None:
         """Return the current rgb value."""
-        if "r" not in self._state or "g" not in self._state or "b" not in self._state:
+        state = self._state
+        try:
+            return state["r"], state["g"], state["b"]
+        except KeyError:
             return None
-        return self._state["r"], self._state["g"], self._state["b"]
 
     @property
     def color_temp(self) -> int | None:
@@ -45,7 +53,7 @@ class SwitchbotBaseLight(SwitchbotDevice):
     @property
     def color_mode(self) -> ColorMode:
         """Return the current color mode."""
-        return ColorMode(self._get_adv_value("color_mode") or 0)
+        return COLOR_MODE_BY_VALUE[self._get_adv_value("color_mode") or 0]
 
     @property
     def min_temp(self) -> int:
@@ -81,6 +89,17 @@ class SwitchbotBaseLight(SwitchbotDevice):
     async def set_rgb(self, brightness: int, r: int, g: int, b: int) -> bool:
         """Set rgb."""
 
+    @staticmethod
+    def _check_rgb(r: int, g: int, b: int) -> None:
+        """Assert that every rgb channel is between 0 and 255."""
+        # The bitwise OR of the channels is outside 0-255 exactly when at
+        # least one channel is, so valid colors need a single comparison.
+        if 0 <= r | g | b <= 255:
+            return
+        assert 0 <= r <= 255, "r must be between 0 and 255"
+        assert 0 <= g <= 255, "g must be between 0 and 255"
+        assert 0 <= b <= 255, "b must be between 0 and 255"
+
     def poll_needed(self, last_poll_time: float | None) -> bool:
         """Return if poll is needed."""
         return False
@@ -98,12 +117,13 @@ class SwitchbotSequenceBaseLight(SwitchbotBaseLight):
         current_state = self._get_adv_value("sequence_number")
         super().update_from_advertisement(advertisement)
         new_state = self._get_adv_value("sequence_number")
-        _LOGGER.debug(
-            "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
-            self.name,
-            advertisement,
-            current_state,
-            new_state,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
+                self.name,
+                advertisement,
+                current_state,
+                new_state,
+            )
         if current_state != new_state:
-            asyncio.ensure_future(self.update())
+            self._schedule_update()
@@ -113,25 +113,27 @@ class SwitchbotBlindTilt(SwitchbotBaseCover, SwitchbotSequenceDevice):
         if not (_data := await self._get_basic_info()):
             return None
 
-        _tilt = max(min(_data[6], 100), 0)
-        _moving = bool(_data[5] & 0b00000011)
+        _, battery, firmware, _, flags, motion, tilt, timers = _data[:8]
+        _tilt = max(min(tilt, 100), 0)
+        _moving = motion & 0b00000011 != 0
         if _moving:
-            _opening = bool(_data[5] & 0b00000010)
-            _closing = not _opening and bool(_data[5] & 0b00000001)
+            _opening = motion & 0b00000010 != 0
+            _closing = not _opening and motion & 0b00000001 != 0
             if _opening:
-                _flag = bool(_data[5] & 0b00000001)
-                _up = _flag if self._reverse else not _flag
+                # Direction bit set means up in reverse mode, down otherwise
+                _up = (motion & 0b00000001 != 0) == self._reverse
             else:
                 _up = _tilt < 50 if self._reverse else _tilt > 50
+        _calibrated = motion & 0b00000100 != 0
 
         return {
-            "battery": _data[1],
-            "firmware": _data[2] / 10.0,
-            "light": bool(_data[4] & 0b00100000),
-            "fault": bool(_data[4] & 0b00001000),
-            "solarPanel": bool(_data[5] & 0b00001000),
-            "calibration": bool(_data[5] & 0b00000100),
-            "calibrated": bool(_data[5] & 0b00000100),
+            "battery": battery,
+            "firmware": firmware / 10.0,
+            "light": flags & 0b00100000 != 0,
+            "fault": flags & 0b00001000 != 0,
+            "solarPanel": motion & 0b00001000 != 0,
+            "calibration": _calibrated,
+            "calibrated": _calibrated,
             "inMotion": _moving,
             "motionDirection": {
                 "opening": _moving and _opening,
@@ -140,7 +142,7 @@ class SwitchbotBlindTilt(SwitchbotBaseCover, SwitchbotSequenceDevice):
                 "down": _moving and not _up,
             },
             "tilt": (100 - _tilt) if self._reverse else _tilt,
-            "timers": _data[7],
+            "timers": timers,
         }
 
     async def get_extended_info_summary(self) -> dict[str, Any] | None:
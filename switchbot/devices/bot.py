@@ -23,6 +23,11 @@ OFF_KEY = f"{BOT_COMMAND_HEADER}02"
 DOWN_KEY = f"{BOT_COMMAND_HEADER}03"
 UP_KEY = f"{BOT_COMMAND_HEADER}04"
 
+# The return value of the command is 1 when the command is successful.
+# The return value of the command is 5 when the bot is in press mode.
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({1, 5})
+SETTINGS_RESULT_EXPECTED_VALUES = frozenset({1})
+
 
 class Switchbot(SwitchbotDeviceOverrideStateDuringConnection):
     """Representation of a Switchbot."""
@@ -30,72 +35,78 @@ class Switchbot(SwitchbotDeviceOverrideStateDuringConnection):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Switchbot Bot/WoHand constructor."""
         super().__init__(*args, **kwargs)
-        self._inverse: bool = kwargs.pop("inverse_mode", False)
+        self._inverse: bool = bool(kwargs.pop("inverse_mode", False))
 
     @update_after_operation
     async def turn_on(self) -> bool:
         """Turn device on."""
         result = await self._send_command(ON_KEY)
-        ret = self._check_command_result(result, 0, {1, 5})
-        self._override_state({"isOn": True})
-        _LOGGER.debug(
-            "%s: Turn on result: %s -> %s",
-            self.name,
-            result.hex() if result else None,
-            self._override_adv_data,
-        )
-        self._fire_callbacks()
+        ret = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
+        changed = self._override_state({"isOn": True})
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Turn on result: %s -> %s",
+                self.name,
+                result.hex() if result else None,
+                self._override_adv_data,
+            )
+        if changed:
+            self._fire_callbacks()
         return ret
 
     @update_after_operation
     async def turn_off(self) -> bool:
         """Turn device off."""
         result = await self._send_command(OFF_KEY)
-        ret = self._check_command_result(result, 0, {1, 5})
-        self._override_state({"isOn": False})
-        _LOGGER.debug(
-            "%s: Turn off result: %s -> %s",
-            self.name,
-            result.hex() if result else None,
-            self._override_adv_data,
-        )
-        self._fire_callbacks()
+        ret = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
+        changed = self._override_state({"isOn": False})
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Turn off result: %s -> %s",
+                self.name,
+                result.hex() if result else None,
+                self._override_adv_data,
+            )
+        if changed:
+            self._fire_callbacks()
         return ret
 
     @update_after_operation
     async def hand_up(self) -> bool:
         """Raise device arm."""
         result = await self._send_command(UP_KEY)
-        return self._check_command_result(result, 0, {1, 5})
+        return self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
 
     @update_after_operation
     async def hand_down(self) -> bool:
         """Lower device arm."""
         result = await self._send_command(DOWN_KEY)
-        return self._check_command_result(result, 0, {1, 5})
+        return self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
 
     @update_after_operation
     async def press(self) -> bool:
         """Press command to device."""
         result = await self._send_command(PRESS_KEY)
-        return self._check_command_result(result, 0, {1, 5})
+        return self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
 
     @update_after_operation
     async def set_switch_mode(
         self, switch_mode: bool = False, strength: int = 100, inverse: bool = False
     ) -> bool:
         """Change bot mode."""
-        mode_key = format(switch_mode, "b") + format(inverse, "b")
-        strength_key = f"{strength:0{2}x}"  # to hex with padding to double digit
-        result = await self._send_command(DEVICE_SET_MODE_KEY + strength_key + mode_key)
-        return self._check_command_result(result, 0, {1})
+        # Switch mode goes in the high nibble, inverse in the low nibble
+        mode = switch_mode << 4 | inverse
+        result = await self._send_command(
+            DEVICE_SET_MODE_KEY + bytes((strength, mode)).hex()
+        )
+        return self._check_command_result(result, 0, SETTINGS_RESULT_EXPECTED_VALUES)
 
     @update_after_operation
     async def set_long_press(self, duration: int = 0) -> bool:
         """Set bot long press duration."""
         duration_key = f"{duration:0{2}x}"  # to hex with padding to double digit
         result = await self._send_command(DEVICE_SET_EXTENDED_KEY + "08" + duration_key)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, SETTINGS_RESULT_EXPECTED_VALUES)
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Get device basic settings."""
@@ -118,6 +129,4 @@ class Switchbot(SwitchbotDeviceOverrideStateDuringConnection):
         if value is None:
             return None
 
-        if self._inverse:
-            return not value
-        return value
+        return bool(value) ^ self._inverse
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
-from .base_light import SwitchbotBaseLight
+from .base_light import BRIGHTNESS_COLOR_TEMP_PACK, SwitchbotBaseLight
 from .device import REQ_HEADER, ColorMode
 
 CEILING_LIGHT_COMMAND_HEADER = "5401"
@@ -14,6 +15,7 @@ CEILING_LIGHT_OFF_KEY = f"{CEILING_LIGHT_COMMAND}02FF01FFFF"
 CW_BRIGHTNESS_KEY = f"{CEILING_LIGHT_COMMAND}010001"
 BRIGHTNESS_KEY = f"{CEILING_LIGHT_COMMAND}01FF01"
 
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({0x01})
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,41 +31,39 @@ class SwitchbotCeilingLight(SwitchbotBaseLight):
     async def turn_on(self) -> bool:
         """Turn device on."""
         result = await self._send_command(CEILING_LIGHT_ON_KEY)
-        ret = self._check_command_result(result, 0, {0x01})
-        self._override_state({"isOn": True})
-        self._fire_callbacks()
-        return ret
+        return self._apply_result(result, {"isOn": True})
 
     async def turn_off(self) -> bool:
         """Turn device off."""
         result = await self._send_command(CEILING_LIGHT_OFF_KEY)
-        ret = self._check_command_result(result, 0, {0x01})
-        self._override_state({"isOn": False})
-        self._fire_callbacks()
-        return ret
+        return self._apply_result(result, {"isOn": False})
 
     async def set_brightness(self, brightness: int) -> bool:
         """Set brightness."""
         assert 0 <= brightness <= 100, "Brightness must be between 0 and 100"
         result = await self._send_command(f"{BRIGHTNESS_KEY}{brightness:02X}0FA1")
-        ret = self._check_command_result(result, 0, {0x01})
-        self._override_state({"brightness": brightness, "isOn": True})
-        self._fire_callbacks()
-        return ret
+        return self._apply_result(result, {"brightness": brightness, "isOn": True})
 
     async def set_color_temp(self, brightness: int, color_temp: int) -> bool:
         """Set color temp."""
         assert 0 <= brightness <= 100, "Brightness must be between 0 and 100"
         assert 2700 <= color_temp <= 6500, "Color Temp must be between 0 and 100"
         result = await self._send_command(
-            f"{CW_BRIGHTNESS_KEY}{brightness:02X}{color_temp:04X}"
+            CW_BRIGHTNESS_KEY + BRIGHTNESS_COLOR_TEMP_PACK(brightness, color_temp).hex()
         )
-        ret = self._check_command_result(result, 0, {0x01})
+        ret = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
         self._state["cw"] = color_temp
         self._override_state({"brightness": brightness, "isOn": True})
         self._fire_callbacks()
         return ret
 
+    def _apply_result(self, result: bytes | None, state: dict[str, Any]) -> bool:
+        """Check command result and override device state."""
+        ret = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
+        if self._override_state(state):
+            self._fire_callbacks()
+        return ret
+
     async def set_rgb(self, brightness: int, r: int, g: int, b: int) -> bool:
         """Set rgb."""
         # Not supported on this device
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 from ..models import SwitchBotAdvertisement
@@ -30,6 +31,18 @@ STOP_KEYS = [f"{REQ_HEADER}{COVER_COMMAND}0001", f"{REQ_HEADER}{COVER_COMMAND}00
 CURTAIN_EXT_CHAIN_INFO_KEY = f"{REQ_HEADER}468101"
 
 
+@lru_cache(maxsize=8)
+def _open_command(speed: int) -> str:
+    """Return the speed-specific open command."""
+    return f"{OPEN_KEYS[1]}{speed:02X}00"
+
+
+@lru_cache(maxsize=8)
+def _close_command(speed: int) -> str:
+    """Return the speed-specific close command."""
+    return f"{CLOSE_KEYS[1]}{speed:02X}64"
+
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -68,9 +81,7 @@ class SwitchbotCurtain(SwitchbotBaseCover):
         """Send open command. Speed 255 - normal, 1 - slow"""
         self._is_opening = True
         self._is_closing = False
-        return await self._send_multiple_commands(
-            [OPEN_KEYS[0], f"{OPEN_KEYS[1]}{speed:02X}00"]
-        )
+        return await self._send_multiple_commands([OPEN_KEYS[0], _open_command(speed)])
 
     @update_after_operation
     async def close(self, speed: int = 255) -> bool:
@@ -78,7 +89,7 @@ class SwitchbotCurtain(SwitchbotBaseCover):
         self._is_closing = True
         self._is_opening = False
         return await self._send_multiple_commands(
-            [CLOSE_KEYS[0], f"{CLOSE_KEYS[1]}{speed:02X}64"]
+            [CLOSE_KEYS[0], _close_command(speed)]
         )
 
     @update_after_operation
@@ -91,9 +102,12 @@ class SwitchbotCurtain(SwitchbotBaseCover):
     async def set_position(self, position: int, speed: int = 255) -> bool:
         """Send position command (0-100) to device. Speed 255 - normal, 1 - slow"""
         direction_adjusted_position = (100 - position) if self._reverse else position
-        self._update_motion_direction(
-            True, self._get_adv_value("position"), direction_adjusted_position
-        )
+        previous_position = self._get_adv_value("position")
+        # Moving to the current position leaves the direction unchanged
+        if previous_position != direction_adjusted_position:
+            self._update_motion_direction(
+                True, previous_position, direction_adjusted_position
+            )
         return await super().set_position(position, speed)
 
     def get_position(self) -> Any:
@@ -106,30 +120,32 @@ class SwitchbotCurtain(SwitchbotBaseCover):
         if not (_data := await self._get_basic_info()):
             return None
 
-        _position = max(min(_data[6], 100), 0)
+        _, battery, firmware, chain, settings, flags, position, timers = _data[:8]
+        _position = max(min(position, 100), 0)
         _direction_adjusted_position = (100 - _position) if self._reverse else _position
         _previous_position = self._get_adv_value("position")
-        _in_motion = bool(_data[5] & 0b01000011)
+        _in_motion = flags & 0b01000011 != 0
+        _calibrated = flags & 0b00000100 != 0
         self._update_motion_direction(
             _in_motion, _previous_position, _direction_adjusted_position
         )
 
         return {
-            "battery": _data[1],
-            "firmware": _data[2] / 10.0,
-            "chainLength": _data[3],
+            "battery": battery,
+            "firmware": firmware / 10.0,
+            "chainLength": chain,
             "openDirection": (
-                "right_to_left" if _data[4] & 0b10000000 == 128 else "left_to_right"
+                "right_to_left" if settings & 0b10000000 else "left_to_right"
             ),
-            "touchToOpen": bool(_data[4] & 0b01000000),
-            "light": bool(_data[4] & 0b00100000),
-            "fault": bool(_data[4] & 0b00001000),
-            "solarPanel": bool(_data[5] & 0b00001000),
-            "calibration": bool(_data[5] & 0b00000100),
-            "calibrated": bool(_data[5] & 0b00000100),
+            "touchToOpen": settings & 0b01000000 != 0,
+            "light": settings & 0b00100000 != 0,
+            "fault": settings & 0b00001000 != 0,
+            "solarPanel": flags & 0b00001000 != 0,
+            "calibration": _calibrated,
+            "calibrated": _calibrated,
             "inMotion": _in_motion,
             "position": _direction_adjusted_position,
-            "timers": _data[7],
+            "timers": timers,
         }
 
     def _update_motion_direction(
@@ -143,8 +159,9 @@ class SwitchbotCurtain(SwitchbotBaseCover):
             return
 
         if new_position != previous_position:
-            self._is_opening = new_position > previous_position
-            self._is_closing = new_position < previous_position
+            opening = new_position > previous_position
+            self._is_opening = opening
+            self._is_closing = not opening
 
     async def get_extended_info_summary(self) -> dict[str, Any] | None:
         """Get extended info for all devices in chain."""
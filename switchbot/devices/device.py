@@ -8,6 +8,7 @@ import logging
 import time
 from dataclasses import replace
 from enum import Enum
+from functools import lru_cache
 from typing import Any, TypeVar, cast
 from collections.abc import Callable
 from uuid import UUID
@@ -64,6 +65,9 @@ class ColorMode(Enum):
     EFFECT = 3
 
 
+COLOR_MODE_BY_VALUE = {mode.value: mode for mode in ColorMode}
+
+
 # If the scanner is in passive mode, we
 # need to poll the device to get the
 # battery and a few rarely updating
@@ -79,19 +83,25 @@ class SwitchbotOperationError(Exception):
     """Raised when an operation fails."""
 
 
-def _sb_uuid(comms_type: str = "service") -> UUID | str:
-    """Return Switchbot UUID."""
-
-    _uuid = {"tx": "002", "rx": "003", "service": "d00"}
+READ_CHAR_UUID = UUID("cba20003-224d-11e6-9fb8-0002a5d5c51b")
+WRITE_CHAR_UUID = UUID("cba20002-224d-11e6-9fb8-0002a5d5c51b")
+# bleak reports characteristic UUIDs as lowercase strings
+_READ_CHAR_UUID_STR = str(READ_CHAR_UUID)
+_WRITE_CHAR_UUID_STR = str(WRITE_CHAR_UUID)
 
-    if comms_type in _uuid:
-        return UUID(f"cba20{_uuid[comms_type]}-224d-11e6-9fb8-0002a5d5c51b")
+_SB_UUIDS = {
+    "tx": WRITE_CHAR_UUID,
+    "rx": READ_CHAR_UUID,
+    "service": UUID("cba20d00-224d-11e6-9fb8-0002a5d5c51b"),
+}
 
-    return "Incorrect type, choose between: tx, rx or service"
 
+def _sb_uuid(comms_type: str = "service") -> UUID | str:
+    """Return Switchbot UUID."""
+    if comms_type in _SB_UUIDS:
+        return _SB_UUIDS[comms_type]
 
-READ_CHAR_UUID = _sb_uuid(comms_type="rx")
-WRITE_CHAR_UUID = _sb_uuid(comms_type="tx")
+    return "Incorrect type, choose between: tx, rx or service"
 
 
 WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
@@ -110,6 +120,12 @@ def update_after_operation(func: WrapFuncType) -> WrapFuncType:
     return cast(WrapFuncType, _async_update_after_operation_wrap)
 
 
+@lru_cache(maxsize=256)
+def _command_bytes(command: str) -> bytes:
+    """Return the bytes to write for a hex encoded command."""
+    return bytes.fromhex(command)
+
+
 def _merge_data(old_data: dict[str, Any], new_data: dict[str, Any]) -> dict[str, Any]:
     """Merge data but only add None keys if they are missing."""
     merged = old_data.copy()
@@ -138,6 +154,8 @@ class SwitchbotBaseDevice:
         """Switchbot base class constructor."""
         self._interface = f"hci{interface}"
         self._device = device
+        self._name_source = (device.name, device.address)
+        self._name = f"{device.name} ({device.address})"
         self._sb_adv_data: SwitchBotAdvertisement | None = None
         self._override_adv_data: dict[str, Any] | None = None
         self._scan_timeout: int = kwargs.pop("scan_timeout", DEFAULT_SCAN_TIMEOUT)
@@ -153,13 +171,17 @@ class SwitchbotBaseDevice:
         self._client: BleakClientWithServiceCache | None = None
         self._read_char: BleakGATTCharacteristic | None = None
         self._write_char: BleakGATTCharacteristic | None = None
+        self._char_handles: tuple[int, int] | None = None
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_deadline: float = 0.0
         self._expected_disconnect = False
-        self.loop = asyncio.get_event_loop()
-        self._callbacks: list[Callable[[], None]] = []
+        # Rebuilt on (un)subscribe so callbacks can unsubscribe while firing
+        self._callbacks: tuple[Callable[[], None], ...] = ()
         self._notify_future: asyncio.Future[bytearray] | None = None
         self._last_full_update: float = -PASSIVE_POLL_INTERVAL
         self._timed_disconnect_task: asyncio.Task[None] | None = None
+        self._update_task: asyncio.Future[None] | None = None
+        self._update_pending = False
 
     @classmethod
     async def api_request(
@@ -210,10 +232,11 @@ class SwitchbotBaseDevice:
         """Send command to device and read response."""
         if retry is None:
             retry = self._retry_count
-        command = bytearray.fromhex(self._commandkey(key))
-        _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
+        command = _command_bytes(self._commandkey(key))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
         max_attempts = retry + 1
-        if self._operation_lock.locked():
+        if self._operation_lock.locked() and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "%s: Operation already in progress, waiting for it to complete; RSSI: %s",
                 self.name,
@@ -265,10 +288,15 @@ class SwitchbotBaseDevice:
 
         raise RuntimeError("Unreachable")
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running event loop."""
+        return asyncio.get_running_loop()
+
     @property
     def name(self) -> str:
         """Return device name."""
-        return f"{self._device.name} ({self._device.address})"
+        return self._name
 
     @property
     def data(self) -> dict[str, Any]:
@@ -291,31 +319,34 @@ class SwitchbotBaseDevice:
 
     async def _ensure_connected(self):
         """Ensure connection to device is established."""
-        if self._connect_lock.locked():
+        if self._connect_lock.locked() and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "%s: Connection already in progress, waiting for it to complete; RSSI: %s",
                 self.name,
                 self.rssi,
             )
         if self._client and self._client.is_connected:
-            _LOGGER.debug(
-                "%s: Already connected before obtaining lock, resetting timer; RSSI: %s",
-                self.name,
-                self.rssi,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Already connected before obtaining lock, resetting timer; RSSI: %s",
+                    self.name,
+                    self.rssi,
+                )
             self._reset_disconnect_timer()
             return
         async with self._connect_lock:
             # Check again while holding the lock
             if self._client and self._client.is_connected:
-                _LOGGER.debug(
-                    "%s: Already connected after obtaining lock, resetting timer; RSSI: %s",
-                    self.name,
-                    self.rssi,
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "%s: Already connected after obtaining lock, resetting timer; RSSI: %s",
+                        self.name,
+                        self.rssi,
+                    )
                 self._reset_disconnect_timer()
                 return
-            _LOGGER.debug("%s: Connecting; RSSI: %s", self.name, self.rssi)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Connecting; RSSI: %s", self.name, self.rssi)
             client: BleakClientWithServiceCache = await establish_connection(
                 BleakClientWithServiceCache,
                 self._device,
@@ -324,7 +355,8 @@ class SwitchbotBaseDevice:
                 use_services_cache=True,
                 ble_device_callback=lambda: self._device,
             )
-            _LOGGER.debug("%s: Connected; RSSI: %s", self.name, self.rssi)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Connected; RSSI: %s", self.name, self.rssi)
             self._client = client
 
             try:
@@ -342,30 +374,59 @@ class SwitchbotBaseDevice:
                 await self._execute_disconnect_with_lock()
                 raise
 
-            _LOGGER.debug(
-                "%s: Starting notify and disconnect timer; RSSI: %s",
-                self.name,
-                self.rssi,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Starting notify and disconnect timer; RSSI: %s",
+                    self.name,
+                    self.rssi,
+                )
             self._reset_disconnect_timer()
             await self._start_notify()
 
     def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> None:
         """Resolve characteristics."""
+        if self._char_handles and self._resolve_characteristics_by_handle(services):
+            return
         self._read_char = services.get_characteristic(READ_CHAR_UUID)
         if not self._read_char:
             raise CharacteristicMissingError(READ_CHAR_UUID)
         self._write_char = services.get_characteristic(WRITE_CHAR_UUID)
         if not self._write_char:
             raise CharacteristicMissingError(WRITE_CHAR_UUID)
+        self._char_handles = (self._read_char.handle, self._write_char.handle)
+
+    def _resolve_characteristics_by_handle(
+        self, services: BleakGATTServiceCollection
+    ) -> bool:
+        """Resolve characteristics from the handles of the previous connection.
+
+        Returns true if both handles still point at the expected characteristics
+        and False if they have to be looked up by UUID again.
+        """
+        read_handle, write_handle = self._char_handles
+        read_char = services.get_characteristic(read_handle)
+        write_char = services.get_characteristic(write_handle)
+        if (
+            read_char is None
+            or write_char is None
+            or read_char.uuid != _READ_CHAR_UUID_STR
+            or write_char.uuid != _WRITE_CHAR_UUID_STR
+        ):
+            return False
+        self._read_char = read_char
+        self._write_char = write_char
+        return True
 
     def _reset_disconnect_timer(self):
         """Reset disconnect timer."""
-        self._cancel_disconnect_timer()
         self._expected_disconnect = False
-        self._disconnect_timer = self.loop.call_later(
-            DISCONNECT_DELAY, self._disconnect_from_timer
-        )
+        self._disconnect_deadline = self.loop.time() + DISCONNECT_DELAY
+        # A pending timer re-arms itself for the new deadline when it fires,
+        # so busy devices do not cancel and reschedule a handle per command
+        if self._disconnect_timer is None:
+            self._disconnect_timer = self.loop.call_at(
+                self._disconnect_deadline, self._disconnect_from_timer
+            )
 
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
@@ -383,6 +444,15 @@ class SwitchbotBaseDevice:
 
     def _disconnect_from_timer(self):
         """Disconnect from device."""
+        timer = self._disconnect_timer
+        self._disconnect_timer = None
+        # Handles may run up to the clock resolution early, so only re-arm
+        # when the deadline was pushed past the one this handle was armed for
+        if timer is not None and self._disconnect_deadline > timer.when():
+            self._disconnect_timer = self.loop.call_at(
+                self._disconnect_deadline, self._disconnect_from_timer
+            )
+            return
         if self._operation_lock.locked() and self._client.is_connected:
             _LOGGER.debug(
                 "%s: Operation in progress, resetting disconnect timer; RSSI: %s",
@@ -391,10 +461,12 @@ class SwitchbotBaseDevice:
             )
             self._reset_disconnect_timer()
             return
-        self._cancel_disconnect_timer()
-        self._timed_disconnect_task = asyncio.create_task(
-            self._execute_timed_disconnect()
+        _LOGGER.debug(
+            "%s: Executing timed disconnect after timeout of %s",
+            self.name,
+            DISCONNECT_DELAY,
         )
+        self._timed_disconnect_task = asyncio.create_task(self._execute_disconnect())
 
     def _cancel_disconnect_timer(self):
         """Cancel disconnect timer."""
@@ -411,15 +483,6 @@ class SwitchbotBaseDevice:
         )
         await self._execute_disconnect()
 
-    async def _execute_timed_disconnect(self) -> None:
-        """Execute timed disconnection."""
-        _LOGGER.debug(
-            "%s: Executing timed disconnect after timeout of %s",
-            self.name,
-            DISCONNECT_DELAY,
-        )
-        await self._execute_disconnect()
-
     async def _execute_disconnect(self) -> None:
         """Execute disconnection."""
         _LOGGER.debug("%s: Executing disconnect", self.name)
@@ -488,7 +551,10 @@ class SwitchbotBaseDevice:
 
     async def _start_notify(self) -> None:
         """Start notification."""
-        _LOGGER.debug("%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi
+            )
         await self._client.start_notify(self._read_char, self._notification_handler)
 
     async def _execute_command_locked(self, key: str, command: bytes) -> bytes:
@@ -517,7 +583,8 @@ class SwitchbotBaseDevice:
                 timeout_handle.cancel()
             self._notify_future = None
 
-        _LOGGER.debug("%s: Notification received: %s", self.name, notify_msg.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Notification received: %s", self.name, notify_msg.hex())
 
         if notify_msg == b"\x07":
             _LOGGER.error("Password required")
@@ -529,22 +596,28 @@ class SwitchbotBaseDevice:
         """Return address of device."""
         return self._device.address
 
-    def _override_state(self, state: dict[str, Any]) -> None:
-        """Override device state."""
+    def _override_state(self, state: dict[str, Any]) -> bool:
+        """Override device state.
+
+        Returns true if the state has changed and False if not.
+        """
+        changed = any(self._get_adv_value(key) != value for key, value in state.items())
         if self._override_adv_data is None:
             self._override_adv_data = {}
         self._override_adv_data.update(state)
         self._update_parsed_data(state)
+        return changed
 
     def _get_adv_value(self, key: str) -> Any:
         """Return value from advertisement data."""
         if self._override_adv_data and key in self._override_adv_data:
-            _LOGGER.debug(
-                "%s: Using override value for %s: %s",
-                self.name,
-                key,
-                self._override_adv_data[key],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Using override value for %s: %s",
+                    self.name,
+                    key,
+                    self._override_adv_data[key],
+                )
             return self._override_adv_data[key]
         if not self._sb_adv_data:
             return None
@@ -558,7 +631,14 @@ class SwitchbotBaseDevice:
         """Update device data from advertisement."""
         # Only accept advertisements if the data is not missing
         # if we already have an advertisement with data
-        self._device = advertisement.device
+        device = advertisement.device
+        self._device = device
+        # bleak updates the name of the same BLEDevice in place once a scan
+        # response carries it, so compare the values the name was built from
+        name_source = (device.name, device.address)
+        if name_source != self._name_source:
+            self._name_source = name_source
+            self._name = f"{device.name} ({device.address})"
 
     async def get_device_data(
         self, retry: int | None = None, interface: int | None = None
@@ -601,14 +681,35 @@ class SwitchbotBaseDevice:
 
     def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
         """Subscribe to device notifications."""
-        self._callbacks.append(callback)
+        self._callbacks = (*self._callbacks, callback)
 
         def _unsub() -> None:
             """Unsubscribe from device notifications."""
-            self._callbacks.remove(callback)
+            callbacks = list(self._callbacks)
+            callbacks.remove(callback)
+            self._callbacks = tuple(callbacks)
 
         return _unsub
 
+    def _schedule_update(self) -> None:
+        """Schedule an update.
+
+        Requests made before a scheduled update starts are merged into it,
+        requests made while it is running trigger one more update afterwards.
+        """
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.ensure_future(self._run_scheduled_updates())
+        else:
+            self._update_pending = True
+
+    async def _run_scheduled_updates(self) -> None:
+        """Run updates until no new request arrived during the last one."""
+        while True:
+            self._update_pending = False
+            await self.update()
+            if not self._update_pending:
+                return
+
     async def update(self, interface: int | None = None) -> None:
         """Update position, battery percent and light level of device."""
         if info := await self.get_basic_info():
@@ -626,7 +727,7 @@ class SwitchbotBaseDevice:
         }
 
     def _check_command_result(
-        self, result: bytes | None, index: int, values: set[int]
+        self, result: bytes | None, index: int, values: set[int] | frozenset[int]
     ) -> bool:
         """Check command result."""
         if not result or len(result) - 1 < index:
@@ -858,12 +959,13 @@ class SwitchbotSequenceDevice(SwitchbotDevice):
         current_state = self._get_adv_value("sequence_number")
         super().update_from_advertisement(advertisement)
         new_state = self._get_adv_value("sequence_number")
-        _LOGGER.debug(
-            "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
-            self.name,
-            advertisement,
-            current_state,
-            new_state,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
+                self.name,
+                advertisement,
+                current_state,
+                new_state,
+            )
         if current_state != new_state:
-            asyncio.ensure_future(self.update())
+            self._schedule_update()
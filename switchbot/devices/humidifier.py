@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from functools import lru_cache
 
 from .device import REQ_HEADER, SwitchbotDevice
 
@@ -19,6 +20,8 @@ HUMIDIFIER_ON_KEY = f"{HUMIDIFIER_COMMAND}010180FFFFFFFF"
 # 2.     570F 4381 0101 43FF FFFF FF
 # 3    . 570F 4381 0101 64FF FFFF FF
 
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({0x01})
+
 MANUAL_BUTTON_PRESSES_TO_LEVEL = {
     101: 33,
     102: 66,
@@ -26,6 +29,13 @@ MANUAL_BUTTON_PRESSES_TO_LEVEL = {
 }
 
 
+@lru_cache(maxsize=512)
+def _humidifier_command(on: bool, level: int) -> str:
+    """Return the command that sets the power state and level."""
+    on_hex = "01" if on else "00"
+    return f"{HUMIDIFIER_COMMAND}01{on_hex}{level:02X}FFFFFFFF"
+
+
 class SwitchbotHumidifier(SwitchbotDevice):
     """Representation of a Switchbot humidifier."""
 
@@ -42,15 +52,14 @@ class SwitchbotHumidifier(SwitchbotDevice):
             level = self.get_target_humidity() or 128
         if on is None:
             on = self.is_on()
-        on_hex = "01" if on else "00"
-        return f"{HUMIDIFIER_COMMAND}01{on_hex}{level:02X}FFFFFFFF"
+        return _humidifier_command(bool(on), level)
 
     async def _async_set_state(self, state: bool) -> bool:
         level = self.get_target_humidity() or 128
         result = await self._send_command(self._generate_command(on=state, level=level))
-        ret = self._check_command_result(result, 0, {0x01})
-        self._override_state({"isOn": state, "level": level})
-        self._fire_callbacks()
+        ret = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
+        if self._override_state({"isOn": state, "level": level}):
+            self._fire_callbacks()
         return ret
 
     async def turn_on(self) -> bool:
@@ -69,9 +78,9 @@ class SwitchbotHumidifier(SwitchbotDevice):
     async def _set_level(self, level: int) -> bool:
         """Set level."""
         result = await self._send_command(self._generate_command(level=level))
-        ret = self._check_command_result(result, 0, {0x01})
-        self._override_state({"level": level})
-        self._fire_callbacks()
+        ret = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
+        if self._override_state({"level": level}):
+            self._fire_callbacks()
         return ret
 
     async def async_set_auto(self) -> bool:
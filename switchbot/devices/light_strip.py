@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 
-from .base_light import SwitchbotSequenceBaseLight
+from .base_light import OFF_STATE_VALUES, ON_STATE_VALUES, SwitchbotSequenceBaseLight
 from .device import REQ_HEADER, ColorMode
 
 STRIP_COMMMAND_HEADER = "4901"
@@ -36,20 +36,20 @@ class SwitchbotLightStrip(SwitchbotSequenceBaseLight):
         """Turn device on."""
         result = await self._send_command(STRIP_ON_KEY)
         self._update_state(result)
-        return self._check_command_result(result, 1, {0x80})
+        return self._check_command_result(result, 1, ON_STATE_VALUES)
 
     async def turn_off(self) -> bool:
         """Turn device off."""
         result = await self._send_command(STRIP_OFF_KEY)
         self._update_state(result)
-        return self._check_command_result(result, 1, {0x00})
+        return self._check_command_result(result, 1, OFF_STATE_VALUES)
 
     async def set_brightness(self, brightness: int) -> bool:
         """Set brightness."""
         assert 0 <= brightness <= 100, "Brightness must be between 0 and 100"
         result = await self._send_command(f"{BRIGHTNESS_KEY}{brightness:02X}")
         self._update_state(result)
-        return self._check_command_result(result, 1, {0x80})
+        return self._check_command_result(result, 1, ON_STATE_VALUES)
 
     async def set_color_temp(self, brightness: int, color_temp: int) -> bool:
         """Set color temp."""
@@ -58,27 +58,26 @@ class SwitchbotLightStrip(SwitchbotSequenceBaseLight):
     async def set_rgb(self, brightness: int, r: int, g: int, b: int) -> bool:
         """Set rgb."""
         assert 0 <= brightness <= 100, "Brightness must be between 0 and 100"
-        assert 0 <= r <= 255, "r must be between 0 and 255"
-        assert 0 <= g <= 255, "g must be between 0 and 255"
-        assert 0 <= b <= 255, "b must be between 0 and 255"
+        self._check_rgb(r, g, b)
         result = await self._send_command(
-            f"{RGB_BRIGHTNESS_KEY}{brightness:02X}{r:02X}{g:02X}{b:02X}"
+            RGB_BRIGHTNESS_KEY + bytes((brightness, r, g, b)).hex()
         )
         self._update_state(result)
-        return self._check_command_result(result, 1, {0x80})
+        return self._check_command_result(result, 1, ON_STATE_VALUES)
 
     def _update_state(self, result: bytes | None) -> None:
         """Update device state."""
         if not result or len(result) < 10:
             return
-        self._state["r"] = result[3]
-        self._state["g"] = result[4]
-        self._state["b"] = result[5]
+        self._state.update({"r": result[3], "g": result[4], "b": result[5]})
         self._override_state(
             {
                 "isOn": result[1] == 0x80,
                 "color_mode": result[10],
             }
         )
-        _LOGGER.debug("%s: update state: %s = %s", self.name, result.hex(), self._state)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: update state: %s = %s", self.name, result.hex(), self._state
+            )
         self._fire_callbacks()
@@ -9,7 +9,7 @@ from typing import Any
 from bleak.backends.device import BLEDevice
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
-from ..const import LockStatus, SwitchbotModel
+from ..const import LOCK_STATUS_BY_VALUE, LockStatus, SwitchbotModel
 from .device import SwitchbotEncryptedDevice
 
 COMMAND_HEADER = "57"
@@ -40,9 +40,10 @@ REST_STATUSES = {LockStatus.LOCKED, LockStatus.UNLOCKED, LockStatus.NOT_FULLY_LO
 _LOGGER = logging.getLogger(__name__)
 
 
-COMMAND_RESULT_EXPECTED_VALUES = {1, 6}
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({1, 6})
 # The return value of the command is 1 when the command is successful.
 # The return value of the command is 6 when the command is successful but the battery is low.
+NOTIFICATION_EXPECTED_VALUES = frozenset({0xF})
 
 
 class SwitchbotLock(SwitchbotEncryptedDevice):
@@ -197,7 +198,9 @@ class SwitchbotLock(SwitchbotEncryptedDevice):
         return not self._notifications_enabled
 
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
-        if self._notifications_enabled and self._check_command_result(data, 0, {0xF}):
+        if self._notifications_enabled and self._check_command_result(
+            data, 0, NOTIFICATION_EXPECTED_VALUES
+        ):
             self._update_lock_status(data)
         else:
             super()._notification_handler(_sender, data)
@@ -215,7 +218,7 @@ class SwitchbotLock(SwitchbotEncryptedDevice):
     def _parse_lock_data(data: bytes) -> dict[str, Any]:
         return {
             "calibration": bool(data[0] & 0b10000000),
-            "status": LockStatus((data[0] & 0b01110000) >> 4),
+            "status": LOCK_STATUS_BY_VALUE[(data[0] & 0b01110000) >> 4],
             "door_open": bool(data[0] & 0b00000100),
             "unclosed_alarm": bool(data[1] & 0b00100000),
             "unlocked_alarm": bool(data[1] & 0b00010000),
@@ -10,6 +10,8 @@ from .device import REQ_HEADER, SwitchbotDeviceOverrideStateDuringConnection
 PLUG_ON_KEY = f"{REQ_HEADER}50010180"
 PLUG_OFF_KEY = f"{REQ_HEADER}50010100"
 
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({0x80})
+
 
 class SwitchbotPlugMini(SwitchbotDeviceOverrideStateDuringConnection):
     """Representation of a Switchbot plug mini."""
@@ -22,17 +24,17 @@ class SwitchbotPlugMini(SwitchbotDeviceOverrideStateDuringConnection):
     async def turn_on(self) -> bool:
         """Turn device on."""
         result = await self._send_command(PLUG_ON_KEY)
-        ret = self._check_command_result(result, 1, {0x80})
-        self._override_state({"isOn": True})
-        self._fire_callbacks()
+        ret = self._check_command_result(result, 1, COMMAND_RESULT_EXPECTED_VALUES)
+        if self._override_state({"isOn": True}):
+            self._fire_callbacks()
         return ret
 
     async def turn_off(self) -> bool:
         """Turn device off."""
         result = await self._send_command(PLUG_OFF_KEY)
-        ret = self._check_command_result(result, 1, {0x80})
-        self._override_state({"isOn": False})
-        self._fire_callbacks()
+        ret = self._check_command_result(result, 1, COMMAND_RESULT_EXPECTED_VALUES)
+        if self._override_state({"isOn": False}):
+            self._fire_callbacks()
         return ret
 
     def is_on(self) -> bool | None:
@@ -20,6 +20,8 @@ COMMAND_GET_VOLTAGE_AND_CURRENT = f"{COMMAND_HEADER}0f7106000000"
 COMMAND_GET_SWITCH_STATE = f"{COMMAND_HEADER}0f7101000000"
 PASSIVE_POLL_INTERVAL = 10 * 60
 
+COMMAND_RESULT_EXPECTED_VALUES = frozenset({1})
+
 
 class SwitchbotRelaySwitch(SwitchbotEncryptedDevice):
     """Representation of a Switchbot relay switch 1pm."""
@@ -60,13 +62,14 @@ class SwitchbotRelaySwitch(SwitchbotEncryptedDevice):
         current_state = self._get_adv_value("sequence_number")
         super().update_from_advertisement(advertisement)
         new_state = self._get_adv_value("sequence_number")
-        _LOGGER.debug(
-            "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
-            self.name,
-            advertisement,
-            current_state,
-            new_state,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
+                self.name,
+                advertisement,
+                current_state,
+                new_state,
+            )
         if current_state != new_state:
             self._force_next_update = True
 
@@ -80,7 +83,7 @@ class SwitchbotRelaySwitch(SwitchbotEncryptedDevice):
     async def get_voltage_and_current(self) -> dict[str, Any] | None:
         """Get voltage and current because advtisement don't have these"""
         result = await self._send_command(COMMAND_GET_VOLTAGE_AND_CURRENT)
-        ok = self._check_command_result(result, 0, {1})
+        ok = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
         if ok:
             return {
                 "voltage": ((result[9] << 8) + result[10]) / 10,
@@ -91,7 +94,7 @@ class SwitchbotRelaySwitch(SwitchbotEncryptedDevice):
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Get the current state of the switch."""
         result = await self._send_command(COMMAND_GET_SWITCH_STATE)
-        if self._check_command_result(result, 0, {1}):
+        if self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES):
             return {
                 "is_on": result[1] & 0x01 != 0,
             }
@@ -115,25 +118,25 @@ class SwitchbotRelaySwitch(SwitchbotEncryptedDevice):
     async def turn_on(self) -> bool:
         """Turn device on."""
         result = await self._send_command(COMMAND_TURN_ON)
-        ok = self._check_command_result(result, 0, {1})
+        ok = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
         if ok:
-            self._override_state({"isOn": True})
-            self._fire_callbacks()
+            if self._override_state({"isOn": True}):
+                self._fire_callbacks()
         return ok
 
     async def turn_off(self) -> bool:
         """Turn device off."""
         result = await self._send_command(COMMAND_TURN_OFF)
-        ok = self._check_command_result(result, 0, {1})
+        ok = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
         if ok:
-            self._override_state({"isOn": False})
-            self._fire_callbacks()
+            if self._override_state({"isOn": False}):
+                self._fire_callbacks()
         return ok
 
     async def async_toggle(self, **kwargs) -> bool:
         """Toggle device."""
         result = await self._send_command(COMMAND_TOGGLE)
-        status = self._check_command_result(result, 0, {1})
+        status = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
         return status
 
     def is_on(self) -> bool | None:
@@ -163,7 +166,7 @@ class SwitchbotRelaySwitch(SwitchbotEncryptedDevice):
         result = await self._send_command(
             COMMAND_GET_CK_IV + self._key_id, encrypt=False
         )
-        ok = self._check_command_result(result, 0, {1})
+        ok = self._check_command_result(result, 0, COMMAND_RESULT_EXPECTED_VALUES)
         if ok:
             self._iv = result[4:]
 
@@ -7,6 +7,7 @@ from bleak.backends.scanner import AdvertisementData
 
 from switchbot import LockStatus, SwitchbotModel
 from switchbot.adv_parser import parse_advertisement_data
+from switchbot.adv_parsers.meter import process_wosensorth_bulk
 from switchbot.models import SwitchBotAdvertisement
 
 ADVERTISEMENT_DATA_DEFAULTS = {
@@ -927,6 +928,16 @@ def test_wosensor_active_zero_data():
     )
 
 
+def test_wosensor_bulk():
+    """Test parsing a batch of wosensor temperature frames."""
+    result = process_wosensorth_bulk(b"\x06\x985\x03\x06\xb5\x00\x00\x00")
+    assert result == {
+        "temperature": (24.6, -6.3, -0.0),
+        "humidity": (53, 53, 0),
+        "fahrenheit": (False, True, False),
+    }
+
+
 def test_wohub2_passive_and_active():
     """Test parsing wosensor as passive with active data as well."""
     ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
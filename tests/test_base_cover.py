@@ -74,7 +74,9 @@ async def test_stop():
 async def test_set_position():
     base_cover_device = create_device_for_command_testing()
     await base_cover_device.set_position(50)
-    base_cover_device._send_multiple_commands.assert_awaited_once()
+    base_cover_device._send_multiple_commands.assert_awaited_once_with(
+        (f"{base_cover.POSITION_KEYS[0]}32", f"{base_cover.POSITION_KEYS[1]}FF32")
+    )
 
 
 @pytest.mark.asyncio
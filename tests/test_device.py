@@ -0,0 +1,212 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from switchbot import SwitchBotAdvertisement, SwitchbotModel
+from switchbot.devices import device, plug
+
+from .test_adv_parser import generate_ble_device
+
+
+def make_advertisement_data(ble_device: BLEDevice, sequence_number: int):
+    """Set advertisement data with defaults."""
+
+    return SwitchBotAdvertisement(
+        address="aa:bb:cc:dd:ee:ff",
+        data={
+            "rawAdvData": b"$X|\x0866G\x81\x00\x00\x001\x00\x00\x00\x00",
+            "data": {"sequence_number": sequence_number, "isOn": True},
+            "isEncrypted": False,
+            "model": "<",
+            "modelFriendlyName": "Relay Switch 1PM",
+            "modelName": SwitchbotModel.RELAY_SWITCH_1PM,
+        },
+        device=ble_device,
+        rssi=-80,
+        active=True,
+    )
+
+
+def create_sequence_device():
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    sequence_device = device.SwitchbotSequenceDevice(ble_device)
+    sequence_device.update_from_advertisement(make_advertisement_data(ble_device, 1))
+    return sequence_device, ble_device
+
+
+@pytest.mark.asyncio
+async def test_sequence_changes_before_update_starts_are_merged():
+    sequence_device, ble_device = create_sequence_device()
+    sequence_device.update = AsyncMock()
+    sequence_device.update_from_advertisement(make_advertisement_data(ble_device, 2))
+    sequence_device.update_from_advertisement(make_advertisement_data(ble_device, 3))
+    await sequence_device._update_task
+    assert sequence_device.update.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sequence_change_during_update_runs_another_update():
+    sequence_device, ble_device = create_sequence_device()
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def _update():
+        started.set()
+        await release.wait()
+
+    sequence_device.update = AsyncMock(side_effect=_update)
+    sequence_device.update_from_advertisement(make_advertisement_data(ble_device, 2))
+    await started.wait()
+    sequence_device.update_from_advertisement(make_advertisement_data(ble_device, 3))
+    release.set()
+    await sequence_device._update_task
+    assert sequence_device.update.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_disconnect_timer_waits_for_last_reset(monkeypatch):
+    monkeypatch.setattr(device, "DISCONNECT_DELAY", 0.05)
+    switchbot_device = device.SwitchbotDevice(
+        generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    )
+    disconnected = asyncio.Event()
+
+    async def _execute_disconnect():
+        disconnected.set()
+
+    switchbot_device._execute_disconnect = AsyncMock(side_effect=_execute_disconnect)
+    loop = asyncio.get_running_loop()
+    for _ in range(3):
+        switchbot_device._reset_disconnect_timer()
+        last_reset = loop.time()
+        await asyncio.sleep(0.02)
+    assert not disconnected.is_set()
+    await asyncio.wait_for(disconnected.wait(), 1)
+    elapsed = loop.time() - last_reset
+    resolution = time.get_clock_info("monotonic").resolution
+    assert elapsed >= device.DISCONNECT_DELAY - resolution
+    switchbot_device._execute_disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_override_state_fires_callbacks_only_on_change():
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    plug_device = plug.SwitchbotPlugMini(ble_device)
+    plug_device.update_from_advertisement(make_advertisement_data(ble_device, 1))
+    plug_device._send_command = AsyncMock(return_value=b"\x01\x80")
+    callback_calls = []
+    plug_device.subscribe(lambda: callback_calls.append(plug_device.is_on()))
+
+    await plug_device.turn_on()
+    assert callback_calls == []
+
+    await plug_device.turn_off()
+    assert callback_calls == [False]
+
+    await plug_device.turn_off()
+    assert callback_calls == [False]
+
+    await plug_device.turn_on()
+    assert callback_calls == [False, True]
+
+    plug_device.update_from_advertisement(make_advertisement_data(ble_device, 2))
+    await plug_device.turn_on()
+    assert callback_calls == [False, True]
+
+
+def make_services(characteristics):
+    """Build a service collection that looks characteristics up by handle or UUID."""
+    by_key = {}
+    for char in characteristics:
+        by_key[char.handle] = char
+        by_key[char.uuid] = char
+
+    services = Mock()
+    services.get_characteristic = Mock(
+        side_effect=lambda specifier: by_key.get(
+            specifier if isinstance(specifier, int) else str(specifier)
+        )
+    )
+    return services
+
+
+def make_characteristic(handle: int, uuid: object):
+    return Mock(handle=handle, uuid=str(uuid))
+
+
+def test_resolve_characteristics_reuses_handles():
+    switchbot_device = device.SwitchbotDevice(
+        generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    )
+    read_char = make_characteristic(13, device.READ_CHAR_UUID)
+    write_char = make_characteristic(16, device.WRITE_CHAR_UUID)
+    switchbot_device._resolve_characteristics(make_services([read_char, write_char]))
+    assert switchbot_device._char_handles == (13, 16)
+
+    services = make_services([read_char, write_char])
+    switchbot_device._resolve_characteristics(services)
+    assert switchbot_device._read_char is read_char
+    assert switchbot_device._write_char is write_char
+    services.get_characteristic.assert_any_call(13)
+    services.get_characteristic.assert_any_call(16)
+    assert services.get_characteristic.call_count == 2
+
+
+def test_resolve_characteristics_falls_back_to_uuid_when_handles_moved():
+    switchbot_device = device.SwitchbotDevice(
+        generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    )
+    switchbot_device._char_handles = (13, 16)
+    other_char = make_characteristic(13, "00002a00-0000-1000-8000-00805f9b34fb")
+    read_char = make_characteristic(20, device.READ_CHAR_UUID)
+    write_char = make_characteristic(16, device.WRITE_CHAR_UUID)
+    switchbot_device._resolve_characteristics(
+        make_services([other_char, read_char, write_char])
+    )
+    assert switchbot_device._read_char is read_char
+    assert switchbot_device._write_char is write_char
+    assert switchbot_device._char_handles == (20, 16)
+
+
+def test_resolve_characteristics_missing_raises():
+    switchbot_device = device.SwitchbotDevice(
+        generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    )
+    switchbot_device._char_handles = (13, 16)
+    services = make_services([make_characteristic(16, device.WRITE_CHAR_UUID)])
+    with pytest.raises(device.CharacteristicMissingError):
+        switchbot_device._resolve_characteristics(services)
+
+
+def test_unsubscribe_from_inside_callback():
+    switchbot_device = device.SwitchbotDevice(
+        generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    )
+    calls = []
+
+    def _first_callback():
+        calls.append("first")
+        unsub_first()
+
+    unsub_first = switchbot_device.subscribe(_first_callback)
+    switchbot_device.subscribe(lambda: calls.append("second"))
+
+    switchbot_device._fire_callbacks()
+    assert calls == ["first", "second"]
+
+    switchbot_device._fire_callbacks()
+    assert calls == ["first", "second", "second"]
+
+
+def test_name_follows_in_place_device_name_update():
+    ble_device = BLEDevice("aa:bb:cc:dd:ee:ff", None, {})
+    switchbot_device = device.SwitchbotDevice(ble_device)
+    switchbot_device.update_from_advertisement(make_advertisement_data(ble_device, 1))
+    assert switchbot_device.name == "None (aa:bb:cc:dd:ee:ff)"
+
+    ble_device.name = "W1234567"
+    switchbot_device.update_from_advertisement(make_advertisement_data(ble_device, 1))
+    assert switchbot_device.name == "W1234567 (aa:bb:cc:dd:ee:ff)"